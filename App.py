@@ -18,15 +18,15 @@ class Widget():
             print("[App] sub routine initialized")
 
         try:
-            locInfo = requests.get("http://ipinfo.io/json").json()
+            locInfo = requests.get("http://ipinfo.io/json", timeout=to).json()
             self.userCountry = locInfo["country"]
-        except:
+        except (requests.exceptions.RequestException, ValueError, KeyError):
             self.userCountry = Web3.toHex(text="Unknown")
         
 
         abis = dict()
-        abis["ConfigRegistry"] = requests.get("https://raw.githubusercontent.com/MathiasExorde/TestnetProtocol-staging/main/ABIs/ConfigRegistry.sol/ConfigRegistry.json", timeout=to).json()
-        abis["DataSpotting"] = requests.get("https://raw.githubusercontent.com/MathiasExorde/TestnetProtocol-staging/main/ABIs/DataSpotting.sol/DataSpotting.json", timeout=to).json()
+        abis["ConfigRegistry"] = http_session.get("https://raw.githubusercontent.com/MathiasExorde/TestnetProtocol-staging/main/ABIs/ConfigRegistry.sol/ConfigRegistry.json", timeout=to).json()
+        abis["DataSpotting"] = http_session.get("https://raw.githubusercontent.com/MathiasExorde/TestnetProtocol-staging/main/ABIs/DataSpotting.sol/DataSpotting.json", timeout=to).json()
 
         # w3 = Web3(Web3.HTTPProvider(netConfig["_urlSkale"]))        
         # w3Tx = Web3(Web3.HTTPProvider(netConfig["_urlTxSkale"]))
@@ -64,8 +64,7 @@ class Widget():
 
                 if("lastTimestamp" not in localconfig["ExordeApp"]):            
                     localconfig["ExordeApp"]["lastTimestamp"] = _timestamp_now
-                    with open("localConfig.json", "w") as f:
-                        json.dump(localconfig, f)
+                    SafeFileWrite("localConfig.json", json.dumps(localconfig))
 
                 if("lastTimestamp" in localconfig["ExordeApp"]):
                     last_ts_ = localconfig["ExordeApp"]["lastTimestamp"]
@@ -74,8 +73,7 @@ class Widget():
                         print("[ Safety Sleep ] Waiting until close, let's reduce repetitive restarts ...")
                         time.sleep(wait_duration)
                     localconfig["ExordeApp"]["lastTimestamp"] = _timestamp_now
-                    with open("localConfig.json", "w") as f:
-                        json.dump(localconfig, f)
+                    SafeFileWrite("localConfig.json", json.dumps(localconfig))
                     exit()
 
 
@@ -111,15 +109,13 @@ class Widget():
                 
             
             if("lastUpdate" not in localconfig["ExordeApp"]):         
-                with open("localConfig.json", "w") as f:
-                    json.dump(localconfig, f)
+                SafeFileWrite("localConfig.json", json.dumps(localconfig))
                     
             if(localconfig["ExordeApp"]["lastUpdate"] != _version or localconfig["ExordeApp"]["lastInfo"] != _lastInfo):  
                 localconfig["ExordeApp"]["lastInfo"] = _lastInfo           
                 localconfig["ExordeApp"]["lastUpdate"] = _version
                 print("[Init Version Check] Updated to Version: ",_version)
-                with open("localConfig.json", "w") as f:
-                    json.dump(localconfig, f)
+                SafeFileWrite("localConfig.json", json.dumps(localconfig))
             else:                
                 print("[Init Version Check] Current Module Version: ",_version)
         except Exception as e:
@@ -325,7 +321,7 @@ class Widget():
                         
                     print("[Faucet] sfuel funding tx = ",tx_receipt.transactionHash.hex())
                     
-                    token_abi = requests.get("https://raw.githubusercontent.com/MathiasExorde/TestnetProtocol-staging/main/ABIs/daostack/controller/daostack/controller/DAOToken.sol/DAOToken.json").json()["abi"]
+                    token_abi = http_session.get("https://raw.githubusercontent.com/MathiasExorde/TestnetProtocol-staging/main/ABIs/daostack/controller/daostack/controller/DAOToken.sol/DAOToken.json").json()["abi"]
                     tok_contract = w3.eth.contract(EXDT_token_address, abi=token_abi)
                         
                     ### 1 - SEND EXDT TOKENS          
@@ -516,8 +512,7 @@ class Widget():
                 print("[Init] New Worker Local Address = ",new_conf["ExordeApp"]["ERCAddress"])
                 print("[Init] First funding of the worker wallet")
             
-            with open('bob.txt', "wb") as file:
-                file.write(self.pKey)
+            SafeFileWrite('bob.txt', self.pKey, binary_=True)
                 
             self.localconfig = new_conf    
 
@@ -526,8 +521,7 @@ class Widget():
                 self.pKey = file.read()
         
         # updating localconfig with new MainERCAddress
-        with open("localConfig.json", "w") as f:
-            json.dump(new_conf,f)
+        SafeFileWrite("localConfig.json", json.dumps(new_conf))
 
         # Autofund anyway, in case worker balance is zero
         try:
@@ -543,8 +537,7 @@ class Widget():
                  
 
     def updateLocalConfig(self):        
-        with open("localConfig.json", "w") as f:
-            json.dump(self.localconfig,f)
+        SafeFileWrite("localConfig.json", json.dumps(self.localconfig))
 
             
     def changeAllowanceGeo(self):
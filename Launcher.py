@@ -43,6 +43,7 @@ import random
 from random import randint
 import re
 import requests
+from requests.adapters import HTTPAdapter
 from requests_html import HTML
 from requests_html import HTMLSession
 from scipy.special import softmax, expit
@@ -77,6 +78,12 @@ import argparse
 RAM_HOLDER_AMOUNT_base = 736000000 # reserve 512Mb of Memory
 ramholder = bytearray(RAM_HOLDER_AMOUNT_base)
 
+## shared keep-alive session: reuses TCP/TLS connections to github & the IPFS gateways
+## instead of paying a new handshake per request (retries stay in the callers' loops)
+http_session = requests.Session()
+http_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+http_session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
 def DownloadSingleIPFSFile(ipfsHash, timeout_=5, max_trials_=2):
     ## constants & parameters
     _headers = {
@@ -87,7 +94,7 @@ def DownloadSingleIPFSFile(ipfsHash, timeout_=5, max_trials_=2):
     }
     for _ in range(max_trials_):
         try:
-            gateways =  requests.get("https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/targets/ipfs_gateways.txt").text.split("\n")[:-1]
+            gateways =  http_session.get("https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/targets/ipfs_gateways.txt").text.split("\n")[:-1]
         except:
             time.sleep(3)
     nb_gateways = len(gateways)
@@ -107,8 +114,8 @@ def DownloadSingleIPFSFile(ipfsHash, timeout_=5, max_trials_=2):
             try:
                 _endpoint_url = _used_gateway+ipfsHash
                 print("\tDownload via: ",_endpoint_url)
-                content = requests.get(_endpoint_url, headers=_headers, stream=False,
-                                       timeout=_used_timeout)
+                content = http_session.get(_endpoint_url, headers=_headers, stream=False,
+                                           timeout=_used_timeout)
                 try:
                     content = content.json()                    
                 except:
@@ -155,8 +162,8 @@ def SafeURLDownload(URL, timeout_=2, max_trials_=3):
             _endpoint_url = URL
             if general_printing_enabled:
                 print("\tDownloading...  ", _endpoint_url)
-            content = requests.get(_endpoint_url, headers=_headers, stream=False,
-                                   timeout=_used_timeout)
+            content = http_session.get(_endpoint_url, headers=_headers, stream=False,
+                                       timeout=_used_timeout)
             if content is not None:
                 isOk = True
             break
@@ -169,10 +176,22 @@ def SafeURLDownload(URL, timeout_=2, max_trials_=3):
         time.sleep(0.3)
     return content
 
+def SafeFileWrite(fp_, content_, binary_=False):
+    ## write a sibling temp file then swap it in, so a process killed mid-write
+    ## never leaves a truncated config/key/launcher file behind
+    tmp_fp = fp_ + ".tmp"
+    if binary_:
+        with open(tmp_fp, "wb") as filetowrite:
+            filetowrite.write(content_)
+    else:
+        with open(tmp_fp, "w", newline='', encoding='utf-8') as filetowrite:
+            filetowrite.write(content_)
+    os.replace(tmp_fp, fp_)
+
 def SelfUpdateProcedure():
     launcher_fp = 'Launcher.py' 
     try:
-        req = requests.get("https://raw.githubusercontent.com/exorde-labs/ExordeModuleCLI/main/Launcher.py")
+        req = http_session.get("https://raw.githubusercontent.com/exorde-labs/ExordeModuleCLI/main/Launcher.py")
         launcher_code_content = req.content
         github_launcher_code_text = req.text
         if len(github_launcher_code_text) < 100:
@@ -191,8 +210,7 @@ def SelfUpdateProcedure():
     try:    
         if(local_launcher_sig != github_launcher_sig):
             # overwrite Launcher
-            with open(launcher_fp, 'w+', newline='', encoding='utf-8') as filetowrite:
-                filetowrite.write(github_launcher_code_text)
+            SafeFileWrite(launcher_fp, github_launcher_code_text)
             print("\n\n*********\nYour Exorde Testnet Module has been updated!\n ---> Please RESTART the program.\nExorde Labs, 2022\n*********")
             exit(1)
     except Exception as e:
@@ -285,10 +303,10 @@ potential_testnet = list()
 networkSelector_url = "https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/targets/NetworkLoadBalancing.json"
 
 try:
-    networkSelector = requests.get(networkSelector_url, timeout=30).json()
+    networkSelector = http_session.get(networkSelector_url, timeout=30).json()
 except Exception as e:
     print(e)
-    print(requests.get(networkSelector_url, timeout=30))
+    print(http_session.get(networkSelector_url, timeout=30))
 
 mainnet_threshold_high = int(networkSelector["mainnet"])
 
@@ -313,10 +331,10 @@ testnet_config_github_url = 'https://raw.githubusercontent.com/MathiasExorde/Tes
 
 if mainnet_selected:
     print("\n-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_ TESTNET CHAIN A -_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_-_")
-    netConfig = requests.get(mainnet_config_github_url, timeout=30).json()
+    netConfig = http_session.get(mainnet_config_github_url, timeout=30).json()
 else:    
     print("\n-*-*--*-*--*-*--*-*--*-*--*-*--*-*--*-*--  TESTNET CHAIN B  *-*--*-*--*-*--*-*--*-*--*-*--*-*--*-*--*-*--*-*--*-*--")
-    netConfig = requests.get(testnet_config_github_url, timeout=30).json()
+    netConfig = http_session.get(testnet_config_github_url, timeout=30).json()
 
 
 ################## NETWORK CONNECTION
@@ -370,11 +388,11 @@ ConfigBypassURL = "https://raw.githubusercontent.com/exorde-labs/TestnetProtocol
 ################## BLOCKCHAIN INTERFACING
 to = 60    
 if mainnet_selected:
-    contracts = requests.get("https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/ContractsAddresses.txt", timeout=to).json()
+    contracts = http_session.get("https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/ContractsAddresses.txt", timeout=to).json()
 else:
-    contracts = requests.get("https://raw.githubusercontent.com/MathiasExorde/TestnetProtocol-staging/main/ContractsAddresses.txt", timeout=to).json()
+    contracts = http_session.get("https://raw.githubusercontent.com/MathiasExorde/TestnetProtocol-staging/main/ContractsAddresses.txt", timeout=to).json()
 abis = dict()
-abis["ConfigRegistry"] = requests.get("https://raw.githubusercontent.com/MathiasExorde/TestnetProtocol-staging/main/ABIs/ConfigRegistry.sol/ConfigRegistry.json", timeout=to).json()
+abis["ConfigRegistry"] = http_session.get("https://raw.githubusercontent.com/MathiasExorde/TestnetProtocol-staging/main/ABIs/ConfigRegistry.sol/ConfigRegistry.json", timeout=to).json()
 
 print("Config Address = ",contracts["ConfigRegistry"])
 contract = w3.eth.contract(contracts["ConfigRegistry"], abi=abis["ConfigRegistry"]["abi"])
@@ -442,7 +460,7 @@ if bypass_enabled == False:
 
 if bypass_enabled or (nb_modules_fetched_from_config != nb_module_to_fetch):
     print("\n****************\n[BYPASS] Fetching from ExordeLabs github: ", ConfigBypassURL)
-    bypassModules = requests.get(ConfigBypassURL).json()
+    bypassModules = http_session.get(ConfigBypassURL).json()
     for im, ModuleURL in enumerate(bypassModules):
         #print(value)
         success = False
@@ -490,8 +508,7 @@ while True:
         
         if("lastUpdate" not in localconfig["ExordeApp"]):            
             localconfig["ExordeApp"]["lastUpdate"] = _version
-            with open("localConfig.json", "w") as f:
-                json.dump(localconfig, f)
+            SafeFileWrite("localConfig.json", json.dumps(localconfig))
         try:
             print("[UPDATE SYSTEM] Last Version: ", localconfig["ExordeApp"]["lastUpdate"], "New:", _version)
         except:
@@ -503,8 +520,7 @@ while True:
             print("Last message from Exorde Labs => ",_lastInfo,"\n***************************.")
             # update localconfig, important
             localconfig["ExordeApp"]["lastUpdate"] = _version
-            with open("localConfig.json", "w") as f:
-                json.dump(localconfig, f)
+            SafeFileWrite("localConfig.json", json.dumps(localconfig))
             exit(1)
     except Exception as e:
         print(e)
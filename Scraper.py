@@ -135,7 +135,7 @@ class Scraper():
     
     def __init__(self, app):
 
-        r = requests.get("https://raw.githubusercontent.com/lukes/ISO-3166-Countries-with-Regional-Codes/master/all/all.csv").text.split("\n")
+        r = http_session.get("https://raw.githubusercontent.com/lukes/ISO-3166-Countries-with-Regional-Codes/master/all/all.csv").text.split("\n")
         names = r[0]
         data = r[1:]
                 
@@ -145,7 +145,7 @@ class Scraper():
         self.langcodes = self.langcodes[self.langcodes.columns[:-1]]
         self.langcodes.columns=names.split(",")
         self.stopWords = dict()
-        self.stopWords["en"] = requests.get("https://raw.githubusercontent.com/LIAAD/yake/master/yake/StopwordsList/stopwords_{}.txt".format("en"), allow_redirects=True, stream=True, timeout=(1,5)).text.replace("\r","").split("\n")
+        self.stopWords["en"] = http_session.get("https://raw.githubusercontent.com/LIAAD/yake/master/yake/StopwordsList/stopwords_{}.txt".format("en"), allow_redirects=True, stream=True, timeout=(1,5)).text.replace("\r","").split("\n")
         self.models = dict()
         self.languages = dict()
         self.threads = list()
@@ -266,7 +266,7 @@ class Scraper():
             results = dict()
             
             try:
-                exd_token = random.choice(list(pd.DataFrame([x.strip().lower() for x in requests.get("https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/targets/keywords.txt").text.replace("\n","").split(",") if x != ""])[0]))
+                exd_token = random.choice(list(pd.DataFrame([x.strip().lower() for x in http_session.get("https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/targets/keywords.txt").text.replace("\n","").split(",") if x != ""])[0]))
             except:
                 exd_token = "bitcoin"
 
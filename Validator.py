@@ -47,7 +47,8 @@ class Validator():
         self.current_batch = 0
         self.current_item = 0
         self.batchLength = 0
-        self.gateWays = requests.get("https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/targets/ipfs_gateways.txt").text.split("\n")
+        self.gateWays = http_session.get("https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/targets/ipfs_gateways.txt").text.split("\n")[:-1]
+        self._gatewaysLastTimestamp = time.time()
         
         if general_printing_enabled:
             print("[Validation {}] IPFS gateways fetched".format(dt.now()))
@@ -75,7 +76,7 @@ class Validator():
             # base_rep_archive_url_ = "https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/Stats/archives/partial_testnets/base_reputation_amount.json"
             base_rep_archive_url_ = "https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/Stats/leaderboard.json"
 
-            base_rep_archive_ = requests.get(base_rep_archive_url_, timeout=to).json()
+            base_rep_archive_ = http_session.get(base_rep_archive_url_, timeout=to).json()
             rep_amount_base_archive = 0
             if main_addr in base_rep_archive_:
                 rep_amount_base_archive = base_rep_archive_[main_addr]
@@ -257,12 +258,19 @@ class Validator():
                 print("[Validation {}] New Work Available Detected.".format(dt.now()))
                 print("[Validation {}] Fetching Work Batch ID".format(dt.now()))
             try:
-                for trial in range(max_trials_):  
-                    try:
-                        gateways =  requests.get("https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/targets/ipfs_gateways.txt").text.split("\n")[:-1]
-                    except:
-                        time.sleep(3)
-                        pass
+                # the gateway list rarely changes: only refetch it once it is older than the TTL
+                now_ts = time.time()
+                delay_between_gateways_refresh = 10*60 # 10 min
+                if ( now_ts - self._gatewaysLastTimestamp ) > delay_between_gateways_refresh:
+                    for trial in range(max_trials_):  
+                        try:
+                            self.gateWays =  http_session.get("https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/targets/ipfs_gateways.txt").text.split("\n")[:-1]
+                            self._gatewaysLastTimestamp = now_ts
+                            break
+                        except:
+                            time.sleep(3)
+                            pass
+                gateways = self.gateWays
                 nb_gateways = len(gateways)
                 
                 
@@ -840,7 +848,7 @@ class Validator():
                         # base_rep_archive_url_ = "https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/Stats/archives/partial_testnets/base_reputation_amount.json"
                         base_rep_archive_url_ = "https://raw.githubusercontent.com/exorde-labs/TestnetProtocol/main/Stats/leaderboard.json"
 
-                        base_rep_archive_ = requests.get(base_rep_archive_url_, timeout=to).json()
+                        base_rep_archive_ = http_session.get(base_rep_archive_url_, timeout=to).json()
                         rep_amount_base_archive = 0
                         if main_addr in base_rep_archive_:
                             rep_amount_base_archive = base_rep_archive_[main_addr]